@@ -27,16 +27,22 @@ Outputs:
 """
 
 import argparse
+import bisect
 import csv
 import glob
 import json
+import mmap
 import os
 import re
 import shlex
 import subprocess
+import sys
 import textwrap
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, namedtuple, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 from typing import List, Dict, Any
 
 # Matplotlib for charts (headless)
@@ -48,31 +54,107 @@ from matplotlib.dates import DateFormatter
 
 # ---------- Log parsing ----------
 
+# Multiline bytes pattern run with finditer() over a whole file. Only WARN/ERROR
+# records match; classes are spelled out in ASCII and separators are [ \t], so a
+# match never spans two lines. A trailing "\r" (CRLF logs) stays out of the message.
+# The message is optional: a record ending at the level (e.g. "- ERROR" followed by
+# a stack trace) still counts, with an empty message.
 LOG_LINE_RE = re.compile(
-    r"^(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3})\s+\S+\s+\S+\s+\S+\s+-\s+(?P<level>\w+)\s+(?P<msg>.*)$"
+    rb"^(?P<ts>[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3})"
+    rb"[ \t]+\S+[ \t]+\S+[ \t]+\S+[ \t]+-[ \t]+(?P<level>ERROR|WARN)(?:[ \t]+(?P<msg>[^\r\n]*))?\r?$",
+    re.MULTILINE,
 )
+_LEVELS = {b"ERROR": "ERROR", b"WARN": "WARN"}
 
-def normalize_message(msg: str) -> str:
-    """Heuristics to consolidate similar messages into 'families'."""
-    m = msg
-    m = re.sub(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b", "{GUID}", m)
-    m = re.sub(r"\b[A-Z0-9]{8,}\b", "{ID}", m)
-    m = re.sub(r"\b\d{6,}\b", "{NUM}", m)
-    m = re.sub(r"\s+", " ", m).strip()
-
-    if "[WSIAuthenticatorImpl] login exception" in m or "WSIAuthenticatorImpl" in m:
-        return "WSIAuthenticatorImpl login exception (authentication failures)"
-    if "MethodName: checkNameCollision" in m or "E_NOT_UNIQUE" in m or "FNRCE0043E" in m:
-        return "checkNameCollision / FNRCE0043E (E_NOT_UNIQUE) – Name already exists"
-    if "MethodName: getContent" in m:
-        return "getContent failures (content retrieval)"
-    if "FNRCE0066E" in m or "E_UNEXPECTED_EXCEPTION" in m:
-        return "FNRCE0066E (E_UNEXPECTED_EXCEPTION) – unexpected error"
-    if "TTLStreamReaper" in m:
-        return "TTLStreamReaper scheduling issue"
+# One parsed WARN/ERROR record. The first four fields are the raw_errors.csv columns.
+LogRow = namedtuple("LogRow", "timestamp level source_file message ts_dt")
+
+# Files at or above this size are memory-mapped instead of read into memory.
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# GUIDs, long upper-case IDs and long numbers are masked in a single pass;
+# the name of the group that matched selects the placeholder.
+_NORM_RE = re.compile(
+    r"(?P<GUID>\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)"
+    r"|(?P<ID>\b[A-Z0-9]{8,}\b)"
+    r"|(?P<NUM>\b\d{6,}\b)"
+)
+
+_FAMILY_AUTH = "WSIAuthenticatorImpl login exception (authentication failures)"
+_FAMILY_NOT_UNIQUE = "checkNameCollision / FNRCE0043E (E_NOT_UNIQUE) – Name already exists"
+_FAMILY_GET_CONTENT = "getContent failures (content retrieval)"
+_FAMILY_UNEXPECTED = "FNRCE0066E (E_UNEXPECTED_EXCEPTION) – unexpected error"
+_FAMILY_TTL_REAPER = "TTLStreamReaper scheduling issue"
+
+# Literal markers -> family, in priority order (first listed family wins).
+FAMILY_MARKERS = [
+    ("WSIAuthenticatorImpl", _FAMILY_AUTH),
+    ("MethodName: checkNameCollision", _FAMILY_NOT_UNIQUE),
+    ("E_NOT_UNIQUE", _FAMILY_NOT_UNIQUE),
+    ("FNRCE0043E", _FAMILY_NOT_UNIQUE),
+    ("MethodName: getContent", _FAMILY_GET_CONTENT),
+    ("FNRCE0066E", _FAMILY_UNEXPECTED),
+    ("E_UNEXPECTED_EXCEPTION", _FAMILY_UNEXPECTED),
+    ("TTLStreamReaper", _FAMILY_TTL_REAPER),
+]
+_FAMILY_BY_MARKER = {marker: (prio, fam) for prio, (marker, fam) in enumerate(FAMILY_MARKERS)}
+# One alternation over all markers, scanned in a single C-level pass per message.
+# (A pyahocorasick automaton was measured 5-10% slower for these few markers.)
+_FAMILY_RE = re.compile("|".join(re.escape(marker) for marker, _ in FAMILY_MARKERS))
+
+
+def _norm_placeholder(m) -> str:
+    return "{" + m.lastgroup + "}"
+
+
+def _normalize_message(msg: str) -> str:
+    m = _NORM_RE.sub(_norm_placeholder, msg)
+    m = " ".join(m.split())
+
+    # Restart one character after each match start so overlapping markers are all seen:
+    # finditer() would let "FNRCE0066E" consume the "E" of "E_NOT_UNIQUE", so
+    # "FNRCE0066E_NOT_UNIQUE" must still map to the E_NOT_UNIQUE family.
+    # (A lookahead alternation also overlaps but defeats re's literal search, ~3x slower.)
+    best = None
+    h = _FAMILY_RE.search(m)
+    while h:
+        hit = _FAMILY_BY_MARKER[h.group()]
+        if hit[0] == 0:
+            return hit[1]
+        if best is None or hit < best:
+            best = hit
+        h = _FAMILY_RE.search(m, h.start() + 1)
+    if best:
+        return best[1]
     return (m[:140] + "…") if len(m) > 140 else m
 
 
+_normalize_message_cached = lru_cache(maxsize=65536)(_normalize_message)
+
+# Longer messages are normalized without caching to keep the cache's memory bounded.
+NORMALIZE_CACHE_MAX_LEN = 2048
+
+
+def normalize_message(msg: str) -> str:
+    """
+    Heuristics to consolidate similar messages into 'families'.
+    Results are memoized per raw message, since identical messages recur constantly.
+    """
+    if len(msg) > NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_message(msg)
+    return _normalize_message_cached(msg)
+
+
+_REL_RE = re.compile(r"(\d+)\s*([wdhms])")
+_REL_UNITS = {
+    "w": timedelta(weeks=1),
+    "d": timedelta(days=1),
+    "h": timedelta(hours=1),
+    "m": timedelta(minutes=1),
+    "s": timedelta(seconds=1),
+}
+
+
 def parse_relative_delta(expr: str):
     """
     Supports: "24h", "2d", "3h30m", "90m", "1w", "1w2d", "48h15m10s", "0h", "now"
@@ -84,76 +166,171 @@ def parse_relative_delta(expr: str):
     if expr in ("now", "0", "0h", "0m", "0s"):
         return timedelta(0)
 
-    patt = re.compile(r"(\d+)\s*([wdhms])")
     total = timedelta(0)
     found = False
-    for m in patt.finditer(expr):
+    for m in _REL_RE.finditer(expr):
         found = True
-        val = int(m.group(1))
-        unit = m.group(2)
-        if unit == "w":
-            total += timedelta(weeks=val)
-        elif unit == "d":
-            total += timedelta(days=val)
-        elif unit == "h":
-            total += timedelta(hours=val)
-        elif unit == "m":
-            total += timedelta(minutes=val)
-        elif unit == "s":
-            total += timedelta(seconds=val)
+        total += _REL_UNITS[m.group(2)] * int(m.group(1))
     if not found:
         raise ValueError(f"Invalid relative time expression: {expr!r}")
     return total
 
 
-def parse_logs(logdir: str, pattern: str, since_dt, until_dt):
+@lru_cache(maxsize=1 << 17)
+def _parse_ts_seconds(s: str) -> datetime:
+    # Fixed layout "YYYY-MM-DDTHH:MM:SS" (guaranteed by LOG_LINE_RE): slice instead of strptime
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+def _parse_ts(ts_str: str) -> datetime:
     """
-    Recursively read all files, filter WARN/ERROR, and apply time window.
+    Parse "YYYY-MM-DDTHH:MM:SS.mmm". Many records share the same second, so the
+    second-resolution part is cached and only the milliseconds are applied per call.
+    Raises ValueError for out-of-range fields, like strptime did.
+    """
+    return _parse_ts_seconds(ts_str[:19]).replace(microsecond=int(ts_str[20:23]) * 1000)
+
+
+@lru_cache(maxsize=1 << 14)
+def _time_buckets(year: int, month: int, day: int, hour: int):
+    """Return the ("YYYY-MM-DD", "YYYY-MM-DD HH:00") time-series keys for an hour."""
+    d = f"{year:04d}-{month:02d}-{day:02d}"
+    return d, f"{d} {hour:02d}:00"
+
+
+def _scan_buffer(buf, pos: int = 0):
+    # Buffers without any "ERROR"/"WARN" literal (e.g. INFO-only logs) are
+    # rejected with a plain substring search before the line regex runs.
+    if buf.find(b"ERROR", pos) < 0 and buf.find(b"WARN", pos) < 0:
+        return
+    for m in LOG_LINE_RE.finditer(buf, pos):
+        ts, level, msg = m.group("ts", "level", "msg")
+        yield ts.decode("ascii"), _LEVELS[level], msg.decode("utf-8", "ignore") if msg else ""
+
+
+def _line_start(buf, i: int) -> int:
+    """Index of the first line start at or after i, or -1 if there is none."""
+    if i == 0:
+        return 0
+    nl = buf.find(b"\n", i - 1)
+    return nl + 1 if nl >= 0 else -1
+
+
+def _iter_log_records(fp: str, tail_bytes: int = None):
+    """
+    Yield (timestamp, level, message) for every WARN/ERROR record in one file.
+    The file is scanned as bytes; only the groups of matching records are decoded.
+    Small files are read in one go; large files are scanned through mmap.
+    With tail_bytes only the last tail_bytes of the file are scanned, starting at
+    the first complete line in that range (like `tail -c`).
+    """
+    with open(fp, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = size - tail_bytes if tail_bytes and size > tail_bytes else 0
+        if size - start < MMAP_THRESHOLD:
+            # also read the byte before the tail to see whether the tail begins a line
+            f.seek(max(start - 1, 0))
+            buf = f.read()
+            pos = _line_start(buf, 1 if start else 0)
+            if pos >= 0:
+                yield from _scan_buffer(buf, pos)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = _line_start(mm, start)
+                if pos >= 0:
+                    yield from _scan_buffer(mm, pos)
+
+
+def find_log_files(logdir: str, pattern: str) -> List[str]:
+    """
+    Recursively collect files matching pattern below logdir.
     """
     files = sorted(glob.glob(os.path.join(logdir, "**", pattern), recursive=True))
     if not files:
         raise SystemExit(f"No log files in {logdir!r} for pattern {pattern!r} (recursive).")
+    return files
 
-    rows = []
+
+def drop_stale_files(files: List[str], since_dt, slack: timedelta) -> List[str]:
+    """
+    Drop files last modified before since_dt - slack: every record in such a file
+    was written before the window starts (e.g. old rotated logs), so it is not read.
+    The slack covers clock/timezone skew between the log writer and this machine;
+    main only calls this when --mtime-slack is given.
+    """
+    if not since_dt:
+        return files
+    cutoff = (since_dt - slack).timestamp()
+    kept = []
     for fp in files:
         try:
-            with open(fp, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    m = LOG_LINE_RE.match(line)
-                    if not m:
-                        continue
-                    ts_str = m.group("ts")
-                    level = m.group("level").upper()
-                    msg = m.group("msg")
-                    if level not in ("ERROR", "WARN"):
-                        continue
-                    try:
-                        ts = datetime.strptime(ts_str, "%Y-%m-%dT%H:%M:%S.%f")
-                    except Exception:
-                        continue
-                    if since_dt and ts < since_dt:
-                        continue
-                    if until_dt and ts > until_dt:
-                        continue
-                    rows.append({
-                        "timestamp": ts_str,
-                        "level": level,
-                        "message": msg.strip(),
-                        "source_file": os.path.basename(fp),
-                    })
+            if os.stat(fp).st_mtime < cutoff:
+                continue
         except FileNotFoundError:
-            # file rotated/removed while reading
+            # file rotated/removed since listing
             continue
+        kept.append(fp)
+    return kept
+
+
+def _parse_one_file(fp: str, since_dt, until_dt, tail_bytes: int = None) -> List[LogRow]:
+    """
+    Filter WARN/ERROR rows of a single file within the time window.
+    Runs in worker processes, so it only takes and returns picklable values.
+    """
+    rows = []
+    # one shared name object for all rows of this file
+    source_file = sys.intern(os.path.basename(fp))
+    try:
+        for ts_str, level, msg in _iter_log_records(fp, tail_bytes):
+            try:
+                ts = _parse_ts(ts_str)
+            except Exception:
+                continue
+            if since_dt and ts < since_dt:
+                continue
+            if until_dt and ts > until_dt:
+                continue
+            rows.append(LogRow(ts_str, level, source_file, msg.strip(), ts))
+    except FileNotFoundError:
+        # file rotated/removed while reading
+        pass
     return rows
 
 
+def parse_logs(files: List[str], since_dt, until_dt, workers: int = 1, tail_bytes: int = None):
+    """
+    Read the given files, filter WARN/ERROR, and apply time window.
+    With workers > 1 files are parsed in parallel processes. Rows are yielded
+    file by file in the order of files, so output does not depend on workers.
+    At most 2 * workers files are in flight, so finished results waiting for the
+    consumer do not pile up in memory.
+    """
+    if workers <= 1 or len(files) <= 1:
+        for fp in files:
+            yield from _parse_one_file(fp, since_dt, until_dt, tail_bytes)
+        return
+
+    workers = min(workers, len(files))
+    parse_one = partial(_parse_one_file, since_dt=since_dt, until_dt=until_dt, tail_bytes=tail_bytes)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        todo = iter(files)
+        pending = deque(pool.submit(parse_one, fp) for fp in islice(todo, 2 * workers))
+        while pending:
+            rows = pending.popleft().result()
+            fp = next(todo, None)
+            if fp is not None:
+                pending.append(pool.submit(parse_one, fp))
+            yield from rows
+
+
 def write_csv(path, rows, fieldnames):
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in fieldnames})
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([r.get(k, "") for k in fieldnames] for r in rows)
 
 
 # ---------- Kubernetes utilities ----------
@@ -214,52 +391,32 @@ def kube_cp_file(namespace: str, pod: str, container: str, remote_full_path: str
 # ---- Copy mode: snapshot (create stable copies in pod, then copy once) ----
 
 def kube_snapshot_then_copy(namespace: str, pod: str, container: str,
-                            remote_path: str, rel_files: List[str],
+                            remote_path: str, file_pattern: str,
                             local_base: str):
     snap_dir = f"/tmp/filenet-log-snap-{int(datetime.now().timestamp())}"
-    # 1) create snapshot structure and copy bytes into new files (cat -> new file)
-    make_and_copy_cmds = []
-    for rel in rel_files:
-        subdir = os.path.dirname(rel) or "."
-        make_and_copy_cmds.append(f'mkdir -p {sh_quote(snap_dir)}/{sh_quote(subdir)}')
-    for rel in rel_files:
-        src = remote_path.rstrip("/") + "/" + rel
-        dst = snap_dir.rstrip("/") + "/" + rel
-        make_and_copy_cmds.append(f'cat {sh_quote(src)} > {sh_quote(dst)}')
-    _run(["kubectl", "exec", "-n", namespace, "-c", container, pod, "--", "sh", "-lc", " && ".join(make_and_copy_cmds)])
-
-    # 2) kubectl cp snapshot dir once
+    # 1) copy matching files into the snapshot dir with one tar pipe (keeps layout and mtimes)
+    snapshot_cmd = (
+        f'mkdir -p {sh_quote(snap_dir)} && '
+        f'cd {sh_quote(remote_path)} && '
+        f'find . -type f -name {sh_quote(file_pattern)} -print0 | '
+        f'tar --null -T - -cf - | tar -xf - -C {sh_quote(snap_dir)}'
+    )
+    _run(["kubectl", "exec", "-n", namespace, "-c", container, pod, "--", "sh", "-lc", snapshot_cmd])
+
+    # 2) stream the snapshot (rooted at its contents) straight into local_base
     os.makedirs(local_base, exist_ok=True)
-    _run(["kubectl", "cp", "-n", namespace, "--container", container, f"{pod}:{snap_dir}", local_base])
-
-    # 3) cleanup
-    _run(["kubectl", "exec", "-n", namespace, "-c", container, pod, "--", "sh", "-lc", f"rm -rf {sh_quote(snap_dir)}"])
-
-    # 4) move files from local snapshot root one level up
-    snap_local_root = os.path.join(local_base, os.path.basename(snap_dir))
-    if os.path.isdir(snap_local_root):
-        for root, _, files in os.walk(snap_local_root):
-            for fn in files:
-                rel_path = os.path.relpath(os.path.join(root, fn), snap_local_root)
-                target_path = os.path.join(local_base, rel_path)
-                os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                os.replace(os.path.join(root, fn), target_path)
-        # clean residual dirs
-        for r, dirs, files in os.walk(snap_local_root, topdown=False):
-            for name in files:
-                try:
-                    os.remove(os.path.join(r, name))
-                except Exception:
-                    pass
-            for name in dirs:
-                try:
-                    os.rmdir(os.path.join(r, name))
-                except Exception:
-                    pass
-        try:
-            os.rmdir(snap_local_root)
-        except Exception:
-            pass
+    remote_cmd = f'tar -czf - -C {sh_quote(snap_dir)} .'
+    stream_cmd = (
+        f'kubectl exec -n {shlex.quote(namespace)} '
+        f'-c {shlex.quote(container)} {shlex.quote(pod)} -- '
+        f'sh -lc {sh_quote(remote_cmd)} '
+        f'| tar -xzf - -C {sh_quote(local_base)}'
+    )
+    try:
+        subprocess.run(stream_cmd, shell=True, check=True)
+    finally:
+        # 3) cleanup
+        _run(["kubectl", "exec", "-n", namespace, "-c", container, pod, "--", "sh", "-lc", f"rm -rf {sh_quote(snap_dir)}"])
 
 
 # ---- Copy mode: tar (robust; mirrors working pipeline) ----
@@ -324,8 +481,11 @@ def kube_sync_pattern_only(namespace: str,
         base = local_base if flatten else os.path.join(local_base, pod)
         os.makedirs(base, exist_ok=True)
 
+        # tar and snapshot select files with their own in-pod find, so only cp lists them first
         if copy_mode == "tar":
             kube_tar_stream(namespace, pod, container, remote_path, file_pattern, base)
+        elif copy_mode == "snapshot":
+            kube_snapshot_then_copy(namespace, pod, container, remote_path, file_pattern, base)
         else:
             rel_files = remote_find_files(namespace, pod, container, remote_path, file_pattern)
             if not rel_files:
@@ -333,9 +493,7 @@ def kube_sync_pattern_only(namespace: str,
                 if single:
                     break
                 continue
-            if copy_mode == "snapshot":
-                kube_snapshot_then_copy(namespace, pod, container, remote_path, rel_files, base)
-            elif copy_mode == "cp":
+            if copy_mode == "cp":
                 for rel in rel_files:
                     remote_full = remote_path.rstrip("/") + "/" + rel
                     local_full = os.path.join(base, rel)
@@ -359,29 +517,46 @@ def kube_sync_pattern_only(namespace: str,
 def _wrap_label(s: str, width: int = 40) -> str:
     return "\n".join(textwrap.wrap(s, width=width, break_long_words=False, break_on_hyphens=True)) or s
 
-def save_top_families_chart(out_path: str, summary: List[Dict[str, Any]], top_n: int = 12):
+def _chart_axes(fig, figsize):
+    """
+    Return (fig, ax, owned). A passed-in figure is cleared and resized for reuse,
+    which skips building a new figure per chart; otherwise a new one is created.
+    """
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+        owned = True
+    else:
+        fig.clear()
+        fig.set_size_inches(*figsize)
+        owned = False
+    return fig, fig.add_subplot(), owned
+
+def save_top_families_chart(out_path: str, summary: List[Dict[str, Any]], top_n: int = 12, fig=None):
     top = summary[:top_n]
     labels = [_wrap_label(s["family"], width=40) for s in top]
     counts = [s["count"] for s in top]
-    plt.figure(figsize=(12, 6))  # wide & tall for readability
+    fig, ax, owned = _chart_axes(fig, (12, 6))  # wide & tall for readability
     y_pos = list(range(len(labels)))
-    plt.barh(y_pos, counts)
-    plt.yticks(y_pos, labels, fontsize=9)
-    plt.gca().invert_yaxis()
-    plt.xlabel("Count", fontsize=10)
-    plt.title("Top error families", fontsize=12)
-    plt.subplots_adjust(left=0.35, right=0.95, top=0.90, bottom=0.15)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=150, bbox_inches="tight")
-    plt.close()
-
-def save_timeseries_chart(out_path: str, series: Dict[str, int], title: str, xlabel: str):
-    plt.figure(figsize=(12, 4))
+    ax.barh(y_pos, counts)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels, fontsize=9)
+    ax.invert_yaxis()
+    ax.set_xlabel("Count", fontsize=10)
+    ax.set_title("Top error families", fontsize=12)
+    fig.subplots_adjust(left=0.35, right=0.95, top=0.90, bottom=0.15)
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=150, bbox_inches="tight")
+    if owned:
+        plt.close(fig)
+
+def save_timeseries_chart(out_path: str, series: Dict[str, int], title: str, xlabel: str, fig=None):
+    fig, ax, owned = _chart_axes(fig, (12, 4))
     if not series:
-        plt.title(title + " (no data)")
-        plt.tight_layout()
-        plt.savefig(out_path, dpi=150, bbox_inches="tight")
-        plt.close()
+        ax.set_title(title + " (no data)")
+        fig.tight_layout()
+        fig.savefig(out_path, dpi=150, bbox_inches="tight")
+        if owned:
+            plt.close(fig)
         return
 
     # Keys are strings like "YYYY-MM-DD" or "YYYY-MM-DD HH:00"
@@ -400,22 +575,22 @@ def save_timeseries_chart(out_path: str, series: Dict[str, int], title: str, xla
     xs = [p[0] for p in parsed]
     ys = [p[1] for p in parsed]
 
-    plt.plot(xs, ys, marker="o", linewidth=1.5, markersize=3)
-    ax = plt.gca()
+    ax.plot(xs, ys, marker="o", linewidth=1.5, markersize=3)
     ax.xaxis.set_major_locator(MaxNLocator(nbins=8, prune=None))
     if all(x.hour == 0 and x.minute == 0 for x in xs):
         ax.xaxis.set_major_formatter(DateFormatter("%Y-%m-%d"))
     else:
         ax.xaxis.set_major_formatter(DateFormatter("%Y-%m-%d %H:%M"))
 
-    plt.xticks(rotation=30, ha="right", fontsize=8)
-    plt.yticks(fontsize=9)
-    plt.title(title, fontsize=12)
-    plt.xlabel(xlabel, fontsize=10)
-    plt.ylabel("Count", fontsize=10)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    plt.setp(ax.get_xticklabels(), rotation=30, ha="right", fontsize=8)
+    plt.setp(ax.get_yticklabels(), fontsize=9)
+    ax.set_title(title, fontsize=12)
+    ax.set_xlabel(xlabel, fontsize=10)
+    ax.set_ylabel("Count", fontsize=10)
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=150, bbox_inches="tight")
+    if owned:
+        plt.close(fig)
 
 # Aspect-ratio–preserving image embedding for PDF
 from reportlab.lib.utils import ImageReader
@@ -461,9 +636,14 @@ def generate_pdf_report(
     top_png = os.path.join(outdir_for_images, "chart_top_families.png")
     daily_png = os.path.join(outdir_for_images, "chart_overall_daily.png")
     hourly_png = os.path.join(outdir_for_images, "chart_overall_hourly.png")
-    save_top_families_chart(top_png, summary, top_n=min(12, len(summary) or 1))
-    save_timeseries_chart(daily_png, daily_counts, "Overall errors per day", "Date")
-    save_timeseries_chart(hourly_png, hourly_counts, "Overall errors per hour", "Hour")
+    # One figure is reused for all charts
+    fig = plt.figure()
+    try:
+        save_top_families_chart(top_png, summary, top_n=min(12, len(summary) or 1), fig=fig)
+        save_timeseries_chart(daily_png, daily_counts, "Overall errors per day", "Date", fig=fig)
+        save_timeseries_chart(hourly_png, hourly_counts, "Overall errors per hour", "Hour", fig=fig)
+    finally:
+        plt.close(fig)
 
     # Page layout
     page_size = rl_landscape(A4) if landscape_mode else A4
@@ -959,6 +1139,15 @@ def main():
                     help='Relative start, e.g. "24h", "2d", "3h30m"')
     ap.add_argument("--until", default="0h",
                     help='Relative end from now, e.g. "0h" (now)')
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Parallel processes for parsing log files (default: CPU count; 1 = no multiprocessing)")
+    ap.add_argument("--mtime-slack", default=None,
+                    help='With --since, skip files last modified more than this before the window start, '
+                         'e.g. "14h". Log timestamps are pod-local wall clock while mtimes are absolute, so '
+                         'the slack must cover the UTC offset between them (opt-in).')
+    ap.add_argument("--tail-bytes", type=int, default=None,
+                    help="Only scan the last N bytes of each file, e.g. 8388608 (8 MiB), for short --since "
+                         "windows on large active logs. Older records in a file are ignored (opt-in).")
 
     # Kubernetes options
     ap.add_argument("--kube-sync", action="store_true",
@@ -1037,70 +1226,88 @@ def main():
         since_dt = now - parse_relative_delta(args.since)
     if since_dt and since_dt > until_dt:
         raise SystemExit(f"Invalid time window: since ({since_dt}) > until ({until_dt})")
-
-    # Analysis
-    rows = parse_logs(analysis_dir, args.pattern, since_dt, until_dt)
+    if args.workers is not None and args.workers < 1:
+        raise SystemExit(f"--workers must be at least 1, got {args.workers}")
+    if args.tail_bytes is not None and args.tail_bytes <= 0:
+        raise SystemExit(f"--tail-bytes must be positive, got {args.tail_bytes}")
+
+    # Analysis: a single pass writes raw_errors.csv, groups families and counts time series
+    files = find_log_files(analysis_dir, args.pattern)
+    if args.mtime_slack is not None and since_dt:
+        n_found = len(files)
+        files = drop_stale_files(files, since_dt, parse_relative_delta(args.mtime_slack))
+        print(f"[Scan] Skipped {n_found - len(files)} of {n_found} file(s) last modified "
+              f"more than {args.mtime_slack} before {since_dt}")
+    workers = args.workers or os.cpu_count() or 1
     raw_csv = os.path.join(args.outdir, "raw_errors.csv")
-    write_csv(raw_csv, rows, ["timestamp", "level", "source_file", "message"])
 
-    families: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for r in rows:
-        families[normalize_message(r["message"])].append(r)
+    # Per family only a count and the k earliest rows are kept, so memory is
+    # O(families * k) instead of O(rows). Examples are sorted (timestamp, seq, row)
+    # tuples; seq keeps arrival order among equal timestamps, as a stable sort would.
+    k = max(1, args.examples)
+    fam_counts: Counter = Counter()
+    fam_examples: Dict[str, List[tuple]] = defaultdict(list)
+    daily: Counter = Counter()
+    hourly: Counter = Counter()
+    fam_daily: Dict[str, Counter] = defaultdict(Counter)
+    fam_hourly: Dict[str, Counter] = defaultdict(Counter)
+    total_entries = 0
+
+    with open(raw_csv, "w", newline="", encoding="utf-8") as raw_f:
+        raw_w = csv.writer(raw_f)
+        raw_w.writerow(["timestamp", "level", "source_file", "message"])
+        for r in parse_logs(files, since_dt, until_dt, workers=workers, tail_bytes=args.tail_bytes):
+            raw_w.writerow(r[:4])
+            fam = normalize_message(r.message)
+            fam_counts[fam] += 1
+            ex = fam_examples[fam]
+            if len(ex) < k or r.timestamp < ex[-1][0]:
+                bisect.insort(ex, (r.timestamp, total_entries, r))
+                if len(ex) > k:
+                    ex.pop()
+
+            dt = r.ts_dt
+            d, h = _time_buckets(dt.year, dt.month, dt.day, dt.hour)
+            daily[d] += 1
+            hourly[h] += 1
+            fam_daily[fam][d] += 1
+            fam_hourly[fam][h] += 1
+            total_entries += 1
 
-    summary = [{"family": fam, "count": len(items)} for fam, items in families.items()]
+    summary = [{"family": fam, "count": cnt} for fam, cnt in fam_counts.items()]
     summary.sort(key=lambda x: x["count"], reverse=True)
     write_csv(os.path.join(args.outdir, "summary.csv"), summary, ["count", "family"])
 
     example_rows: List[Dict[str, Any]] = []
-    for fam, items in families.items():
-        for ex in sorted(items, key=lambda rr: rr["timestamp"])[: max(1, args.examples)]:
+    for fam, items in fam_examples.items():
+        for _, _, ex in items:
             example_rows.append({
                 "family": fam,
-                "timestamp": ex["timestamp"],
-                "source_file": ex["source_file"],
-                "message": ex["message"]
+                "timestamp": ex.timestamp,
+                "source_file": ex.source_file,
+                "message": ex.message
             })
     write_csv(os.path.join(args.outdir, "examples.csv"),
               example_rows, ["family", "timestamp", "source_file", "message"])
 
     # Time series
-    def parse_ts(ts_str: str):
-        return datetime.strptime(ts_str, "%Y-%m-%dT%H:%M:%S.%f")
-
-    daily: Counter = Counter()
-    hourly: Counter = Counter()
-    fam_daily: Dict[str, Counter] = defaultdict(Counter)
-    fam_hourly: Dict[str, Counter] = defaultdict(Counter)
-
-    for fam, items in families.items():
-        for r in items:
-            try:
-                dt = parse_ts(r["timestamp"])
-            except Exception:
-                continue
-            d = dt.strftime("%Y-%m-%d")
-            h = dt.strftime("%Y-%m-%d %H:00")
-            daily[d] += 1
-            hourly[h] += 1
-            fam_daily[fam][d] += 1
-            fam_hourly[fam][h] += 1
-
     def write_rows(path, header, rows_iter):
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
         with open(path, "w", newline="", encoding="utf-8") as f:
             w = csv.writer(f)
             w.writerow(header)
-            for r in rows_iter:
-                w.writerow(r)
+            w.writerows(rows_iter)
+
+    fam_order = [s["family"] for s in summary]
 
     write_rows(os.path.join(args.outdir, "timeseries_overall_daily.csv"), ["date", "count"], sorted(daily.items()))
     write_rows(os.path.join(args.outdir, "timeseries_overall_hourly.csv"), ["datetime_hour", "count"], sorted(hourly.items()))
     write_rows(os.path.join(args.outdir, "timeseries_family_daily.csv"),
                ["date", "family", "count"],
-               ((d, f, cnt) for f in [s["family"] for s in summary] for d, cnt in sorted(fam_daily[f].items())))
+               ((d, f, cnt) for f in fam_order for d, cnt in sorted(fam_daily[f].items())))
     write_rows(os.path.join(args.outdir, "timeseries_family_hourly.csv"),
                ["datetime_hour", "family", "count"],
-               ((h, f, cnt) for f in [s["family"] for s in summary] for h, cnt in sorted(fam_hourly[f].items())))
+               ((h, f, cnt) for f in fam_order for h, cnt in sorted(fam_hourly[f].items())))
 
     # Markdown
     md_path = os.path.join(args.outdir, "summary_markdown.md")
@@ -1159,7 +1366,7 @@ def main():
             example_rows=example_rows,
             daily_counts=dict(daily),
             hourly_counts=dict(hourly),
-            total_entries=len(rows),
+            total_entries=total_entries,
             time_range=time_range,
         )
 